@@ -1,21 +1,39 @@
-import time
-print("Waking up the cat...")
-LOADING_ART = r"""
-      |\      _,,,---,,_
-ZZZzz /,`.-'`'    -.  ;-;;,_
-     |,4-  ) )-,_. ,\ (  `'-'
-    '---''(_/--'  `-'\_)   
-"""
-print(LOADING_ART)
+import os
 
 from catqdm.catbar import cat_bar
-from catqdm.big_cat_bar import big_cat_bar
-
-time.sleep(2)  # Simulate loading time
-LOADED_ART = r"""
-    |\__/,|   (`\
-  _.|o o  |_   ) )
--(((---(((--------
-"""
-print("Cat is ready !")
-print(LOADED_ART)
\ No newline at end of file
+from catqdm.big_cat_bar import big_cat_bar, big_cat_bar_run
+
+# The animation module is only imported when the intro is actually opted
+# in (cheap env check first), or on explicit attribute access below, so
+# plain `import catqdm` doesn't pay for it.
+if os.getenv("CATQDM_ANIMATION", "").lower() == "true":
+    from catqdm.animation import run_cat_animation, should_show_animation
+
+    if should_show_animation():
+        run_cat_animation()
+
+
+def __getattr__(name):
+    if name in ("run_cat_animation", "should_show_animation", "CatAnimation"):
+        from catqdm import animation
+
+        return getattr(animation, name)
+    if name in ("get_cat_for_progress", "get_color_for_progress", "get_rich_cat_with_color"):
+        from catqdm import faces
+
+        return getattr(faces, name)
+    if name == "CatProgressBar":
+        from catqdm.progress_bar import CatProgressBar
+
+        return CatProgressBar
+    if name in ("rich_cat_bar", "CatProgressDisplay"):
+        # Import the submodule contents directly: a `from catqdm import
+        # rich_cat_bar` here would re-enter this __getattr__ and recurse.
+        # The function then shadows the same-named submodule attribute so
+        # repeated lookups stay consistent.
+        from catqdm.rich_cat_bar import CatProgressDisplay, rich_cat_bar
+
+        globals()["rich_cat_bar"] = rich_cat_bar
+        globals()["CatProgressDisplay"] = CatProgressDisplay
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
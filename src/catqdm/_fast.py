@@ -0,0 +1,24 @@
+"""Numeric kernels for CatProgressBar, numba-compiled when available.
+
+The per-render math (elapsed, rate, ETA, filled cells) is kept in one
+pure numbers-only function so it can be JIT-compiled next to a user's
+own numba kernels; without numba the plain Python definition runs
+unchanged. String formatting stays in :mod:`catqdm.progress_bar`.
+"""
+
+
+def compute_metrics(current, total, width, start_mono, now_mono):
+    """Return ``(filled, elapsed, eta, rate)`` for a progress state."""
+    elapsed = now_mono - start_mono
+    rate = current / elapsed if elapsed > 0 else 0.0
+    eta = (total - current) / rate if rate > 0 else 0.0
+    filled = int(current * width // total) if total else 0
+    return filled, elapsed, eta, rate
+
+
+try:  # pragma: no cover - opt-in fast path, exercised only with numba
+    from numba import njit  # type: ignore
+
+    compute_metrics = njit(cache=True)(compute_metrics)
+except Exception:
+    pass
@@ -0,0 +1,173 @@
+"""Intro animation played when catqdm wakes up.
+
+The cat sleeps, stretches, then announces it is ready. Frames are drawn
+in place: the screen is cleared once, then every frame is emitted as a
+single ``write`` (cursor-home + full frame text) so the terminal is not
+flooded with small writes and full-screen clears.
+"""
+import os
+import signal
+import sys
+import threading
+import time
+from typing import NamedTuple, Sequence
+
+SLEEPING_CAT = r"""      |\      _,,,---,,_
+{z} /,`.-'`'    -.  ;-;;,_
+     |,4-  ) )-,_. ,\ (  `'-'
+    '---''(_/--'  `-'\_)"""
+
+STRETCHING_CAT = r"""      |\__/,|   {tail}
+    _.|o o  |_   ) )
+  -(((---(((--------"""
+
+READY_CAT = r"""    |\__/,|   (`\
+  _.|o o  |_   ) )
+-(((---(((--------"""
+
+class Stage(NamedTuple):
+    """One animation stage: a header line, its frames, and the frame delay."""
+
+    header: str
+    frames: Sequence[str]
+    delay: float
+
+
+# Frames and stages are constant, so they are baked once at import time;
+# the animation loop itself only writes pre-built strings.
+_SLEEP_FRAMES = tuple(SLEEPING_CAT.format(z=z) for z in ("ZZZzz", "ZZzz ", "Zz   "))
+_STRETCH_FRAMES = tuple(STRETCHING_CAT.format(tail=t) for t in (r"(`\  ", r" /') "))
+_STAGES = (
+    Stage("Waking up the cat...", _SLEEP_FRAMES, 0.4),
+    Stage("Stretching...", _STRETCH_FRAMES, 0.3),
+)
+
+
+def _screen(body, first=False):
+    """Wrap a frame body in cursor-home/erase escapes.
+
+    The full-screen clear is paid only on the first frame; afterwards each
+    frame re-homes the cursor, erases every repainted line to its end
+    (``\\x1b[K``) and erases whatever is left below (``\\x1b[0J``), so
+    per-frame terminal work stays constant instead of scaling with the
+    viewport.
+    """
+    head = "\x1b[2J\x1b[H" if first else "\x1b[H"
+    return head + body.replace("\n", "\x1b[K\n") + "\x1b[K\n\x1b[0J"
+
+
+def _bake_screens():
+    """Pre-render every full screen (headers + frame) to UTF-8 bytes."""
+    screens = []
+    headers = []
+    first = True
+    for stage in _STAGES:
+        headers.append(stage.header)
+        prefix = "\n".join(headers) + "\n"
+        for frame in stage.frames:
+            screens.append((_screen(prefix + frame, first=first).encode(), stage.delay))
+            first = False
+    final = _screen(prefix + "Cat is ready !\n" + READY_CAT)
+    screens.append((final.encode(), 0.0))
+    return tuple(screens)
+
+
+_SCREENS = _bake_screens()
+
+
+class CatAnimation:
+    """Plays the short sleeping -> stretching -> ready intro."""
+
+    def __init__(self, stream=None):
+        self.stream = stream if stream is not None else sys.stdout
+        self._write = self.stream.write
+        self._stop = threading.Event()
+
+    def stop(self):
+        """Abort the running animation without waiting out the frame delay."""
+        self._stop.set()
+
+    def main_animation(self):
+        # Write the pre-baked byte screens straight to the underlying
+        # binary buffer when there is one: a single write per frame with
+        # no Python-level formatting or encoding left in the loop.
+        buffer = getattr(self.stream, "buffer", None)
+        if buffer is not None:
+            write = buffer.write
+        else:
+            write = lambda b: self._write(b.decode())
+        flush = self.stream.flush
+        # Waiting on an Event instead of time.sleep makes the animation
+        # interruptible: Ctrl+C aborts within microseconds instead of
+        # after up to a full frame delay.
+        self._stop.clear()
+        prev_handler = None
+        try:
+            prev_handler = signal.signal(signal.SIGINT, lambda *a: self._stop.set())
+        except ValueError:  # not on the main thread
+            pass
+        try:
+            # Pace frames against monotonic deadlines instead of fixed
+            # sleeps, so render cost doesn't stretch the total duration and
+            # late frames are dropped instead of stacking up.
+            deadline = time.monotonic()
+            for i, (screen, delay) in enumerate(_SCREENS):
+                deadline += delay
+                if self._stop.is_set():
+                    return
+                if i and delay and time.monotonic() > deadline + delay:
+                    continue
+                write(screen)
+                flush()
+                remaining = deadline - time.monotonic()
+                if remaining > 0 and self._stop.wait(remaining):
+                    return
+        finally:
+            if prev_handler is not None:
+                signal.signal(signal.SIGINT, prev_handler)
+
+
+def should_show_animation():
+    """Whether the import-time intro should play.
+
+    Opt-in via ``CATQDM_ANIMATION=true``, and only on an interactive
+    terminal: piped output, CI runs and notebooks shouldn't pay for (or
+    be garbled by) the escape-code animation.
+    """
+    if os.getenv("CATQDM_ANIMATION", "").lower() != "true":
+        return False
+    if os.getenv("CI"):
+        return False
+    try:
+        return sys.stdout.isatty()
+    except Exception:
+        return False
+
+
+# Singleton used by run_cat_animation: repeat runs reuse the same instance
+# (and its bound writer) instead of re-doing setup each call.
+_ANIMATION = None
+
+
+def run_cat_animation():
+    """Run the intro animation once on stdout.
+
+    Guarded so the intro plays at most once per process tree: the env
+    flag survives ``importlib.reload`` and is inherited by fork-based
+    multiprocessing children, and worker processes never replay it.
+    """
+    global _ANIMATION
+    import multiprocessing
+
+    if multiprocessing.current_process().name != "MainProcess":
+        return
+    if os.environ.get("_CATQDM_RAN"):
+        return
+    os.environ["_CATQDM_RAN"] = "1"
+    if _ANIMATION is None:
+        _ANIMATION = CatAnimation()
+    _ANIMATION.main_animation()
+
+
+if __name__ == "__main__":
+    run_cat_animation()
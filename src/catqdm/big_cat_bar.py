@@ -34,6 +34,7 @@ from __future__ import annotations
 import sys
 import time
 import html
+from functools import lru_cache
 from shutil import get_terminal_size
 from typing import Iterable, Sequence, Any, Iterator, Optional
 
@@ -76,6 +77,16 @@ CAT_TAILS: Sequence[str] = [
     " /')",   # New tail pointing left
 ]
 
+# Eyes centered into their 5-char slot, computed once for the stock set.
+_EYES5 = {e: f"{e:^5}"[:5] for e in CAT_EYES_5PCT}
+
+# Line skeletons, baked once; only the tail (line 1) and eye slot (line 2)
+# ever vary, and %-formatting a tiny static template beats re-running an
+# f-string per render.
+_LINE1_TMPL = "    |\\__/,|   %s"
+_LINE2_TMPL = "  _.|%s|_   ) )"
+_LINE3 = "-(((---(((--------"
+
 # ---------------------------------------------------------------------------
 # Environment detection helpers
 # ---------------------------------------------------------------------------
@@ -88,8 +99,13 @@ def _supports_ansi(stream) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def _in_notebook() -> bool:
-    """Rudimentary notebook detection (IPython kernel / Jupyter / Colab)."""
+    """Rudimentary notebook detection (IPython kernel / Jupyter / Colab).
+
+    Cached: the answer cannot change within a process, and the probe
+    runs once per bar otherwise.
+    """
     try:  # pragma: no cover - light best-effort
         from IPython import get_ipython  # type: ignore
         ip = get_ipython()
@@ -108,47 +124,110 @@ def _in_notebook() -> bool:
 # Rendering helpers
 # ---------------------------------------------------------------------------
 
-def _render_big_cat(*, eyes: str = "o o", tail: str = "(`\\", width: Optional[int] = None) -> Sequence[str]:
+@lru_cache(maxsize=512)
+def _render_big_cat(eyes: str = "o o", tail: str = "(`\\", width: Optional[int] = None) -> Sequence[str]:
     """Return lines for the big cat; center to *width* if provided.
 
     Eyes are centered into a 5-char slot (truncated if longer).
     Tail is used in the first line of the cat art.
+
+    Memoized: there are only ~len(eyes) * len(tails) distinct frames per
+    run, so repeat renders become a dict lookup.
     """
-    eyes5 = f"{eyes:^5}"[:5]
-    line1 = f"    |\\__/,|   {tail}"
-    line2 = f"  _.|{eyes5}|_   ) )"
-    line3 = "-(((---(((--------"
-    lines = [line1, line2, line3]
+    eyes5 = _EYES5.get(eyes) or f"{eyes:^5}"[:5]
+    lines = (_LINE1_TMPL % tail, _LINE2_TMPL % eyes5, _LINE3)
     if width is not None:
         max_len = max(len(l) for l in lines)
         pad = max((width - max_len) // 2, 0)
         if pad:
             pad_str = " " * pad
-            lines = [pad_str + l for l in lines]
+            lines = tuple(pad_str + l for l in lines)
     return lines
 
 
+@lru_cache(maxsize=64)
+def _cat_tmpl(width: Optional[int], max_len: int) -> str:
+    """Pre-padded cat template with ``{tail}``/``{eyes5}`` slots.
+
+    Centering only depends on the target width and the widest line, so the
+    whole three-line skeleton (including its padding) is baked here once.
+    """
+    pad = " " * max((width - max_len) // 2, 0) if width is not None else ""
+    return (
+        pad + (_LINE1_TMPL % "{tail}") + "\n"
+        + pad + (_LINE2_TMPL % "{eyes5}") + "\n"
+        + pad + _LINE3
+    )
+
+
+@lru_cache(maxsize=512)
 def _cat_text_block(eyes: str, tail: str, width: Optional[int]) -> str:
-    """Full text block for printing (joined with newlines)."""
-    return "\n".join(_render_big_cat(eyes=eyes, tail=tail, width=width))
+    """Full text block for printing (joined with newlines). Memoized."""
+    eyes5 = _EYES5.get(eyes) or f"{eyes:^5}"[:5]
+    return _cat_tmpl(width, max(18, 14 + len(tail))).format(tail=tail, eyes5=eyes5)
+
+
+def _cursor_fwd(width: Optional[int], tail: str) -> str:
+    """Cursor-forward escape centering a cat line, or "" when not centering.
+
+    ``ESC[<n>C`` advances the cursor without writing the ~n pad spaces a
+    centered text block would carry, so centered ANSI frames stay a few
+    bytes wide regardless of terminal width. (Tail widths within a run are
+    effectively constant, so the pad doesn't shift between frames.)
+    """
+    if width is None:
+        return ""
+    pad = max((width - max(18, 14 + len(tail))) // 2, 0)
+    return f"\x1b[{pad}C" if pad else ""
+
+
+@lru_cache(maxsize=512)
+def _cat_frame_bytes(eyes: str, tail: str, width: Optional[int], nlines: int) -> bytes:
+    """Complete ANSI frame pre-encoded to UTF-8 bytes.
+
+    Cursor-up prefix, erase-below, cat text and trailing newline in one
+    payload: a redraw on a binary stream is a single write with no
+    text-IO encoding step left on the hot path. Centering is done with
+    cursor-forward escapes instead of literal pad spaces.
+    """
+    fwd = _cursor_fwd(width, tail)
+    block = _cat_text_block(eyes, tail, None)
+    if fwd:
+        block = fwd + block.replace("\n", "\n" + fwd)
+    return (f"\x1b[{nlines}F\x1b[J" + block + "\n").encode()
+
+
+@lru_cache(maxsize=512)
+def _cat_delta_bytes(eyes: str, tail: str, width: Optional[int], nlines: int) -> bytes:
+    """Redraw payload repainting only the two lines that can change.
+
+    The third cat line is static, so after the initial full frame
+    (_cat_frame_bytes) a redraw rewrites lines 1-2 with erase-to-EOL and
+    steps the cursor back over the untouched line 3 — roughly a third
+    fewer bytes per frame, and tqdm's bar below is left alone instead of
+    being erased and repainted.
+    """
+    fwd = _cursor_fwd(width, tail)
+    line1, line2, _ = _cat_text_block(eyes, tail, None).split("\n")
+    return (
+        f"\x1b[{nlines}F\x1b[K" + fwd + line1 + "\n\x1b[K" + fwd + line2 + "\n\n"
+    ).encode()
 
 
 # ------------------------------ ANSI printer ------------------------------
 
 def _make_ansi_cat_printer(nlines: int, stream=None):
+    # Each frame is a single write + flush: cursor move to column 0
+    # *nlines* up, one erase-below (ESC[J) instead of per-line clears,
+    # then the frame text. tqdm repaints its own bar line right after on
+    # its next tick. Streams with a binary buffer take the pre-encoded
+    # bytes path (_cat_frame_bytes) instead of this text printer.
     if stream is None:
         stream = sys.stdout
-    esc = "\x1b["
-
-    def _print(lines: Sequence[str]) -> None:
-        # Move cursor up *nlines* to start of the cat block.
-        stream.write(f"{esc}{nlines}F")  # move cursor to column 0 nlines up
-        for i, ln in enumerate(lines):
-            stream.write("\x1b[2K")  # clear line
-            stream.write(ln)
-            if i < nlines - 1:
-                stream.write("\n")
-        stream.write("\n")  # leave cursor on bar line
+    prefix = f"\x1b[{nlines}F\x1b[J"
+
+    def _print(block: str) -> None:
+        stream.write(prefix + block + "\n")
         stream.flush()
 
     return _print
@@ -156,36 +235,238 @@ def _make_ansi_cat_printer(nlines: int, stream=None):
 
 # ---------------------------- Notebook printer ----------------------------
 
-def _make_nb_cat_printer(initial_block: str):
-    """Return an updater callable that rewrites a notebook display area."""
+# The cat art is constant ASCII with no HTML-special characters; only the
+# eye slot and tail vary. Bake the template once and skip html.escape for
+# the stock eyes/tails (verified HTML-safe below at import), so a frame is
+# two dict lookups + one format instead of an escape scan of the block.
+# Custom eyes/tails are escaped once and cached in the same dicts.
+_NB_TMPL = (
+    "<pre style='margin:0;line-height:1.1;'>"
+    + (_LINE1_TMPL % "{tail}") + "\n"
+    + (_LINE2_TMPL % "{eyes5}") + "\n"
+    + _LINE3 + "</pre>"
+)
+# Quotes are fine inside <pre> text content; only &, < and > need escaping.
+assert not set("&<>").intersection(LOADED_ART + "".join(CAT_EYES_5PCT) + "".join(CAT_TAILS)), \
+    "stock cat art must stay HTML-safe (see _NB_TMPL)"
+_ESCAPED_EYES5 = {e: f"{e:^5}"[:5] for e in CAT_EYES_5PCT}
+_ESCAPED_TAILS = {t: t for t in CAT_TAILS}
+
+
+def _nb_frame_html(eyes: str, tail: str) -> str:
+    eyes5 = _ESCAPED_EYES5.get(eyes)
+    if eyes5 is None:
+        eyes5 = _ESCAPED_EYES5[eyes] = html.escape(f"{eyes:^5}"[:5])
+    tail_esc = _ESCAPED_TAILS.get(tail)
+    if tail_esc is None:
+        tail_esc = _ESCAPED_TAILS[tail] = html.escape(tail)
+    return _NB_TMPL.format(tail=tail_esc, eyes5=eyes5)
+
+
+def _make_nb_cat_printer(initial_eyes: str, initial_tail: str):
+    """Return an updater callable that rewrites a notebook display area.
+
+    The updater takes a pre-rendered HTML payload (see ``_nb_frame_html``),
+    so callers can reuse memoized payloads across frames.
+    """
     try:
         from IPython.display import display, HTML
-        handle = display(HTML(_html_wrap(initial_block)), display_id=True)
+        handle = display(HTML(_nb_frame_html(initial_eyes, initial_tail)), display_id=True)
     except Exception:  # pragma: no cover - fallback to stdout
-        handle = None
+        handle = HTML = None
 
-    def _update(block: str) -> None:
+    def _update(payload: str) -> None:
         if handle is not None:
             try:
-                handle.update(HTML(_html_wrap(block)))
+                handle.update(HTML(payload))
                 return
             except Exception:  # pragma: no cover
                 pass
         # Fallback: print a carriage-returned single line summary when update fails
-        sys.stdout.write("\r" + block.replace("\n", " | "))
+        text = payload[payload.index(">") + 1 : payload.rindex("<")]
+        sys.stdout.write("\r" + text.replace("\n", " | "))
         sys.stdout.flush()
 
     return _update
 
 
-def _html_wrap(text_block: str) -> str:
-    return "<pre style='margin:0;line-height:1.1;'>" + html.escape(text_block) + "</pre>"
-
-
 # ---------------------------------------------------------------------------
 # Progress bar
 # ---------------------------------------------------------------------------
 
+def _compute_frame_ints(n: int, total: int, n_eyes: int, n_tails: int):
+    """Pure index math for a percent-driven frame: ``(eye_idx, tail_idx)``.
+
+    Integer-only: ``(n + 1) * n_eyes // total`` is the percent-bucket
+    index with the float divide/multiply/floor chain algebraically
+    simplified away (and clamping for the 100% step). No strings and no
+    globals, so it can be JIT-compiled when numba is installed; the
+    string lookup happens in the caller.
+    """
+    eye_idx = (n + 1) * n_eyes // total
+    last = n_eyes - 1
+    if eye_idx > last:
+        eye_idx = last
+    return eye_idx, (n // 3) % n_tails
+
+
+try:  # pragma: no cover - opt-in fast path, exercised only with numba
+    from numba import njit  # type: ignore
+
+    _compute_frame_ints = njit(cache=True)(_compute_frame_ints)
+except Exception:
+    pass
+
+
+def _make_frame_fn(eyes, tails, total, pct_driven, eye_by_n, tail_by_n):
+    """Build a ``compute(n) -> (eye, tail)`` closure for the hot loop.
+
+    Every predicate in the eye/tail selection chain is loop-invariant, so
+    the specialization is decided once here; the per-iteration call runs a
+    single pre-picked code path with its inputs bound as locals.
+    """
+    n_eyes = len(eyes) if eyes else 0
+    n_tails = len(tails) if tails else 0
+    default_eye = eyes[0] if eyes else "o o"
+    default_tail = tails[0] if tails else "(`\\"
+
+    # Fully animated percent-driven bars without lookup tables (very large
+    # totals) route their arithmetic through _compute_frame_ints, which is
+    # numba-jitted when available.
+    if eye_by_n is None and pct_driven and n_eyes > 1 and n_tails > 1:
+        def compute(n, _eyes=eyes, _tails=tails, _total=total, _ne=n_eyes,
+                    _nt=n_tails, _ints=_compute_frame_ints):
+            eye_idx, tail_idx = _ints(n, _total, _ne, _nt)
+            return _eyes[eye_idx], _tails[tail_idx]
+
+        return compute
+
+    if eye_by_n is not None:
+        # Iterables may legitimately yield more items than total (tqdm
+        # shows >100% then); clamp to the last entry past the table end.
+        def eye_fn(n, _table=eye_by_n, _last=total - 1):
+            return _table[n if n < _last else _last]
+    elif n_eyes > 1 and pct_driven:
+        def eye_fn(n, _eyes=eyes, _ne=n_eyes, _total=total, _last=n_eyes - 1):
+            idx = (n + 1) * _ne // _total
+            return _eyes[_last if idx > _last else idx]
+    elif n_eyes > 1:
+        def eye_fn(n, _eyes=eyes, _n=n_eyes):
+            return _eyes[n % _n]
+    else:
+        def eye_fn(n, _eye=default_eye):
+            return _eye
+
+    if tail_by_n is not None:
+        # Past the table the tail keeps flipping arithmetically, matching
+        # what the table holds for in-range indices.
+        def tail_fn(n, _table=tail_by_n, _total=total, _tails=tails, _nt=n_tails):
+            return _table[n] if n < _total else _tails[(n // 3) % _nt]
+    elif n_tails > 1 and pct_driven:
+        def tail_fn(n, _tails=tails, _n=n_tails):
+            return _tails[(n // 3) % _n]  # flip every 3 iterations
+    elif n_tails > 1:
+        def tail_fn(n, _tails=tails, _n=n_tails):
+            return _tails[n % _n]
+    else:
+        def tail_fn(n, _tail=default_tail):
+            return _tail
+
+    def compute(n, _eye_fn=eye_fn, _tail_fn=tail_fn):
+        return _eye_fn(n), _tail_fn(n)
+
+    return compute
+
+
+def _index_tables(eyes, tails, total, pct_driven, n_eyes, n_tails):
+    """Per-index eye/tail lookup tables, or ``(None, None)`` when unsuited.
+
+    With a known total the eye/tail of every iteration is a pure function
+    of the index, so the per-iteration arithmetic becomes a list index.
+    Skipped for very large totals to bound memory; the arithmetic path in
+    _make_frame_fn still covers those.
+    """
+    eye_by_n = tail_by_n = None
+    if pct_driven and total <= 100_000:
+        if n_eyes > 1:
+            eye_by_n = [
+                eyes[min((n + 1) * n_eyes // total, n_eyes - 1)]
+                for n in range(total)
+            ]
+        if n_tails > 1:
+            tail_by_n = [tails[(n // 3) % n_tails] for n in range(total)]
+    return eye_by_n, tail_by_n
+
+
+def _emit_static_cat(backend, stream, eye, tail, term_w):
+    """Print the cat once for the static (or nothing-to-animate) path."""
+    if backend == "ansi":
+        print(_cat_text_block(eye, tail, term_w), file=stream)
+    elif backend == "notebook":
+        _make_nb_cat_printer(eye, tail)
+    else:
+        print(_cat_text_block(eye, tail, None), file=stream)
+    stream.flush()
+
+
+def _live_backend(backend, stream, term_w, initial_eye, initial_tail, cat_mininterval):
+    """Set up a live backend and draw the initial cat.
+
+    Returns ``(emit, render_frame, cat_mininterval)`` — the payload
+    emitter, the (eye, tail) -> payload renderer, and the possibly
+    adjusted redraw interval. Reserves the ANSI rows / notebook display
+    area as a side effect.
+    """
+    if backend == "notebook":
+        # Initial cat is not centered; notebooks wrap text differently.
+        # Every update round-trips through the kernel comm channel and
+        # re-renders DOM, so the redraw gate is floored at ~30 fps here
+        # even if the caller asks for cat_mininterval=0.
+        emit = _make_nb_cat_printer(initial_eye, initial_tail)
+        return emit, _nb_frame_html, max(cat_mininterval, 1.0 / 30.0)
+
+    # ansi
+    nlines = _cat_text_block(initial_eye, initial_tail, term_w).count("\n") + 1
+    # Reserve the vertical space so tqdm prints *below* the cat.
+    stream.write("\n" * nlines)
+    stream.flush()
+    buffer = getattr(stream, "buffer", None)
+    if buffer is not None:
+        # Payloads are memoized as fully pre-encoded UTF-8 frames;
+        # emitting one is a single binary write + flush, bypassing the
+        # TextIOWrapper encoder entirely. After the initial full frame,
+        # redraws only repaint the two mutable lines.
+        def render_frame(eye, tail, _w=term_w, _n=nlines):
+            return _cat_delta_bytes(eye, tail, _w, _n)
+
+        def emit(payload, _write=buffer.write, _flush=stream.flush):
+            _write(payload)
+            _flush()
+
+        emit(_cat_frame_bytes(initial_eye, initial_tail, term_w, nlines))
+    else:  # no binary buffer (StringIO, wrapped streams)
+        emit = _make_ansi_cat_printer(nlines, stream=stream)
+
+        def render_frame(eye, tail, _w=term_w):
+            return _cat_text_block(eye, tail, _w)
+
+        emit(render_frame(initial_eye, initial_tail))  # draw once immediately
+    return emit, render_frame, cat_mininterval
+
+
+def _frame_table(compute_frame, render_frame, total):
+    """Payload per iteration index, distinct frames shared by identity."""
+    seen = {}
+    frames = []
+    for i in range(total):
+        key = compute_frame(i)
+        payload = seen.get(key)
+        if payload is None:
+            payload = seen[key] = render_frame(*key)
+        frames.append(payload)
+    return frames, seen
+
+
 def big_cat_bar(
     iterable: Iterable[Any],
     *,
@@ -196,6 +477,8 @@ def big_cat_bar(
     stream=None,
     live: Optional[bool] = None,
     center_term: bool = True,
+    cat_mininterval: float = 0.1,
+    update_batch: Optional[int] = None,
     **tqdm_kwargs,
 ) -> Iterator[Any]:
     """Iterate *iterable* with a big-cat progress bar.
@@ -221,12 +504,30 @@ def big_cat_bar(
         auto (Notebook if running in one, else ANSI if TTY, else static).
     center_term:
         Center cat horizontally when using ANSI mode. Ignored in notebook mode.
+    cat_mininterval:
+        Minimum seconds between cat redraws (like tqdm's ``mininterval``),
+        so fast iterables don't flood the terminal/notebook. The final
+        frame is always drawn.
+    update_batch:
+        Push progress into tqdm every this-many iterations (counts are
+        also flushed whenever the cat redraws, and once at the end).
+        Default None auto-tunes to ~1000 tqdm updates per run.
     tqdm_kwargs:
         Passed through to tqdm.
     """
     if stream is None:
         stream = sys.stdout
 
+    # Nothing will ever be shown: skip the cat machinery entirely and just
+    # iterate through a disabled tqdm.
+    if tqdm_kwargs.get("disable"):
+        with tqdm(iterable, desc=desc, **tqdm_kwargs) as pbar:
+            for item in pbar:
+                yield item
+                if sleep_per:
+                    time.sleep(sleep_per)
+        return
+
     in_nb = _in_notebook()
     ansi_ok = _supports_ansi(stream)
 
@@ -238,6 +539,10 @@ def big_cat_bar(
     if live:
         backend = "notebook" if in_nb else ("ansi" if ansi_ok else "static")
 
+    # One terminal-size lookup (an ioctl syscall) per call, shared by every
+    # path that centers the cat.
+    term_w = get_terminal_size().columns if (backend == "ansi" and center_term) else None
+
     total = tqdm_kwargs.pop("total", None)
     if total is None and hasattr(iterable, "__len__"):
         try:
@@ -246,117 +551,241 @@ def big_cat_bar(
             total = None
 
     pct_driven = total is not None and total > 0
-    if eyes and len(eyes) > 1:
-        eye_step = 100.0 / len(eyes)
-    else:
-        eye_step = 100.0  # never advance
-    
-    if tails and len(tails) > 1:
-        tail_step = 100.0 / len(tails)
-    else:
-        tail_step = 100.0  # never advance
+
+    # Loop-invariant facts about the eye/tail sets, computed exactly once.
+    n_eyes = len(eyes) if eyes else 0
+    n_tails = len(tails) if tails else 0
+    default_eye = eyes[0] if n_eyes else "o o"
+    default_tail = tails[0] if n_tails else "(`\\"
+    animated = n_eyes > 1 or n_tails > 1
 
     bar_format = tqdm_kwargs.pop("bar_format", "{l_bar}{bar}{r_bar}")
     tqdm_kwargs.setdefault("dynamic_ncols", True)
 
-    # --------------------------- STATIC PATH ---------------------------
-    if backend == "static":
-        initial_eye = eyes[0] if eyes and len(eyes) > 0 else "o o"
-        initial_tail = tails[0] if tails and len(tails) > 0 else "(`\\"
-        static_cat = _cat_text_block(initial_eye, initial_tail, width=None)
-        print(static_cat, file=stream)
-        stream.flush()
-        with tqdm(total=total, bar_format=bar_format, desc=desc, **tqdm_kwargs) as pbar:
-            for item in iterable:
-                yield item
-                pbar.update(1)
-                if sleep_per:
-                    time.sleep(sleep_per)
-        stream.write("\n")
-        stream.flush()
-        return
+    eye_by_n, tail_by_n = _index_tables(eyes, tails, total, pct_driven, n_eyes, n_tails)
+    compute_frame = _make_frame_fn(eyes, tails, total, pct_driven, eye_by_n, tail_by_n)
 
-    # --------------------------- NOTEBOOK PATH -------------------------
-    if backend == "notebook":
-        # Display initial cat block (not centered; notebooks wrap text differently)
-        initial_eye = eyes[0] if eyes and len(eyes) > 0 else "o o"
-        initial_tail = tails[0] if tails and len(tails) > 0 else "(`\\"
-        block = _cat_text_block(initial_eye, initial_tail, width=None)
-        printer = _make_nb_cat_printer(block)
+    # --------------------- STATIC / NOTHING-TO-ANIMATE -----------------
+    # A live backend with single-state eyes and tails has nothing to
+    # animate either: both cases print the cat once and run a plain tqdm.
+    if backend == "static" or not animated:
+        _emit_static_cat(backend, stream, default_eye, default_tail, term_w)
+        _sleep = time.sleep
         with tqdm(total=total, bar_format=bar_format, desc=desc, **tqdm_kwargs) as pbar:
+            _update = pbar.update
             for item in iterable:
-                if eyes and len(eyes) > 1 and pct_driven:
-                    pct = ((pbar.n + 1) / total) * 100.0
-                    idx = int(pct // eye_step)
-                    if idx >= len(eyes):
-                        idx = len(eyes) - 1
-                    eye = eyes[idx]
-                elif eyes and len(eyes) > 1:
-                    eye = eyes[pbar.n % len(eyes)]
-                else:
-                    eye = eyes[0] if eyes else "o o"
-
-                if tails and len(tails) > 1 and pct_driven:
-                    # Make tail movement more frequent - alternate every few iterations
-                    tail_idx = (pbar.n // 3) % len(tails)  # Change every 3 iterations
-                    tail = tails[tail_idx]
-                elif tails and len(tails) > 1:
-                    tail = tails[pbar.n % len(tails)]
-                else:
-                    tail = tails[0] if tails else "(`\\"
-
-                printer(_cat_text_block(eye, tail, width=None))
                 yield item
-                pbar.update(1)
+                _update(1)
                 if sleep_per:
-                    time.sleep(sleep_per)
+                    _sleep(sleep_per)
+        if backend != "notebook":
+            stream.write("\n")
+            stream.flush()
         return
 
-    # --------------------------- ANSI PATH -----------------------------
-    term_w = get_terminal_size().columns if center_term else None
-    initial_eye = eyes[0] if eyes and len(eyes) > 0 else "o o"
-    initial_tail = tails[0] if tails and len(tails) > 0 else "(`\\"
-    init_lines = _render_big_cat(eyes=initial_eye, tail=initial_tail, width=term_w)
-    nlines = len(init_lines)
-
-    # Reserve the vertical space so tqdm prints *below* the cat.
-    stream.write("\n" * nlines)
-    stream.flush()
-    printer = _make_ansi_cat_printer(nlines, stream=stream)
-    printer(init_lines)  # draw once immediately so we see something
+    # ----------------------- LIVE PATHS (one driver) -------------------
+    # The notebook and ANSI loops only ever differed in how a frame is
+    # emitted; everything else is shared below via a backend emit(eye, tail).
+    initial_eye = default_eye
+    initial_tail = default_tail
+
+    emit, render_frame, cat_mininterval = _live_backend(
+        backend, stream, term_w, initial_eye, initial_tail, cat_mininterval
+    )
+
+    # With a small known total, every frame payload can be rendered up
+    # front: the hot loop then only indexes a list, with the handful of
+    # distinct payloads shared (and compared) by identity.
+    frame_by_n = None
+    if pct_driven and total <= 10_000:
+        frame_by_n, seen = _frame_table(compute_frame, render_frame, total)
+
+    last_key = (initial_eye, initial_tail)
+    last_payload = seen.get(last_key) if frame_by_n is not None else None
+    last_draw = time.monotonic()
+    # Track progress in a plain local instead of reading pbar.n back each
+    # iteration, and push accumulated counts into tqdm in batches: every
+    # update_batch iterations, whenever the cat redraws, and once at the
+    # end. Auto-tune to ~1000 tqdm updates per run when not given.
+    if update_batch is None:
+        update_batch = max(1, total // 1000) if pct_driven else 1
+    n = 0
+    pending = 0
+    # Hot-loop names bound as locals: the loop body below only touches
+    # LOAD_FAST slots, never module globals or repeated attribute lookups.
+    _monotonic = time.monotonic
+    _sleep = time.sleep
 
     with tqdm(total=total, bar_format=bar_format, desc=desc, **tqdm_kwargs) as pbar:
+        _update = pbar.update
         for item in iterable:
-            if eyes and len(eyes) > 1 and pct_driven:
-                pct = ((pbar.n + 1) / total) * 100.0
-                idx = int(pct // eye_step)
-                if idx >= len(eyes):
-                    idx = len(eyes) - 1
-                eye = eyes[idx]
-            elif eyes and len(eyes) > 1:
-                eye = eyes[pbar.n % len(eyes)]
-            else:
-                eye = eyes[0] if eyes else "o o"
-
-            if tails and len(tails) > 1 and pct_driven:
-                # Make tail movement more frequent - alternate every few iterations
-                tail_idx = (pbar.n // 3) % len(tails)  # Change every 3 iterations
-                tail = tails[tail_idx]
-            elif tails and len(tails) > 1:
-                tail = tails[pbar.n % len(tails)]
+            # Most iterations land in the same frame as the previous one;
+            # skip the redraw entirely then. Redraws are additionally
+            # rate-limited to cat_mininterval, except for the final frame
+            # which is always drawn. Past total (iterables may overrun a
+            # caller-supplied count) the table is exhausted, so items fall
+            # through to compute_frame, which clamps.
+            if frame_by_n is not None and n < total:
+                payload = frame_by_n[n]
+                if payload is not last_payload:
+                    now = _monotonic()
+                    if now - last_draw >= cat_mininterval or n + 1 == total:
+                        emit(payload)
+                        last_payload = payload
+                        last_draw = now
+                        if pending:
+                            _update(pending)
+                            pending = 0
             else:
-                tail = tails[0] if tails else "(`\\"
-
-            lines = _render_big_cat(eyes=eye, tail=tail, width=term_w)
-            printer(lines)
+                eye, tail = compute_frame(n)
+                if (eye, tail) != last_key:
+                    now = _monotonic()
+                    if now - last_draw >= cat_mininterval or n + 1 == total:
+                        emit(render_frame(eye, tail))
+                        last_key = (eye, tail)
+                        last_draw = now
+                        if pending:
+                            _update(pending)
+                            pending = 0
 
             yield item
-            pbar.update(1)
+            n += 1
+            pending += 1
+            if pending >= update_batch:
+                _update(pending)
+                pending = 0
             if sleep_per:
-                time.sleep(sleep_per)
+                _sleep(sleep_per)
+        if pending:
+            _update(pending)
 
-    stream.write("\n")  # clean line after completion
-    stream.flush()
+    if backend == "ansi":
+        stream.write("\n")  # clean line after completion
+        stream.flush()
+
+
+def big_cat_bar_run(
+    total: int,
+    work=None,
+    *,
+    eyes: Optional[Sequence[str]] = CAT_EYES_5PCT,
+    tails: Optional[Sequence[str]] = CAT_TAILS,
+    desc: str = "Mood Upgrade",
+    stream=None,
+    live: Optional[bool] = None,
+    center_term: bool = True,
+    cat_mininterval: float = 0.1,
+    update_batch: Optional[int] = None,
+    **tqdm_kwargs,
+) -> None:
+    """Run a big-cat bar for *total* steps without generator overhead.
+
+    Non-generator sibling of :func:`big_cat_bar` for scripts that drive a
+    known number of steps and don't need yielded items: the loop runs
+    inline, calling ``work(n)`` each step when given, which saves one
+    generator suspend/resume round trip per iteration. Parameters match
+    :func:`big_cat_bar` (minus ``sleep_per``).
+    """
+    if stream is None:
+        stream = sys.stdout
+
+    if tqdm_kwargs.get("disable"):
+        with tqdm(total=total, desc=desc, **tqdm_kwargs) as pbar:
+            _update = pbar.update
+            for n in range(total):
+                if work is not None:
+                    work(n)
+                _update(1)
+        return
+
+    in_nb = _in_notebook()
+    ansi_ok = _supports_ansi(stream)
+    if live is None:
+        live = True if in_nb or ansi_ok else False
+    backend = "static"
+    if live:
+        backend = "notebook" if in_nb else ("ansi" if ansi_ok else "static")
+    term_w = get_terminal_size().columns if (backend == "ansi" and center_term) else None
+
+    pct_driven = total > 0
+    n_eyes = len(eyes) if eyes else 0
+    n_tails = len(tails) if tails else 0
+    default_eye = eyes[0] if n_eyes else "o o"
+    default_tail = tails[0] if n_tails else "(`\\"
+    animated = n_eyes > 1 or n_tails > 1
+
+    bar_format = tqdm_kwargs.pop("bar_format", "{l_bar}{bar}{r_bar}")
+    tqdm_kwargs.setdefault("dynamic_ncols", True)
+
+    if backend == "static" or not animated:
+        _emit_static_cat(backend, stream, default_eye, default_tail, term_w)
+        with tqdm(total=total, bar_format=bar_format, desc=desc, **tqdm_kwargs) as pbar:
+            _update = pbar.update
+            for n in range(total):
+                if work is not None:
+                    work(n)
+                _update(1)
+        if backend != "notebook":
+            stream.write("\n")
+            stream.flush()
+        return
+
+    eye_by_n, tail_by_n = _index_tables(eyes, tails, total, pct_driven, n_eyes, n_tails)
+    compute_frame = _make_frame_fn(eyes, tails, total, pct_driven, eye_by_n, tail_by_n)
+    emit, render_frame, cat_mininterval = _live_backend(
+        backend, stream, term_w, default_eye, default_tail, cat_mininterval
+    )
+
+    frame_by_n = None
+    if pct_driven and total <= 10_000:
+        frame_by_n, seen = _frame_table(compute_frame, render_frame, total)
+
+    last_key = (default_eye, default_tail)
+    last_payload = seen.get(last_key) if frame_by_n is not None else None
+    last_draw = time.monotonic()
+    if update_batch is None:
+        update_batch = max(1, total // 1000) if pct_driven else 1
+    pending = 0
+    _monotonic = time.monotonic
+
+    with tqdm(total=total, bar_format=bar_format, desc=desc, **tqdm_kwargs) as pbar:
+        _update = pbar.update
+        for n in range(total):
+            if frame_by_n is not None and n < total:
+                payload = frame_by_n[n]
+                if payload is not last_payload:
+                    now = _monotonic()
+                    if now - last_draw >= cat_mininterval or n + 1 == total:
+                        emit(payload)
+                        last_payload = payload
+                        last_draw = now
+                        if pending:
+                            _update(pending)
+                            pending = 0
+            else:
+                eye, tail = compute_frame(n)
+                if (eye, tail) != last_key:
+                    now = _monotonic()
+                    if now - last_draw >= cat_mininterval or n + 1 == total:
+                        emit(render_frame(eye, tail))
+                        last_key = (eye, tail)
+                        last_draw = now
+                        if pending:
+                            _update(pending)
+                            pending = 0
+
+            if work is not None:
+                work(n)
+            pending += 1
+            if pending >= update_batch:
+                _update(pending)
+                pending = 0
+        if pending:
+            _update(pending)
+
+    if backend == "ansi":
+        stream.write("\n")
+        stream.flush()
 
 
 # ---------------------------------------------------------------------------
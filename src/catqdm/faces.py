@@ -0,0 +1,90 @@
+"""Cat faces and progress-to-mood lookups shared by the catqdm bars.
+
+Progress is effectively quantized (tqdm ticks 1 of N, callers pass whole
+percents), so every getter here is a single read from a dense 101-entry
+table baked at import time — no per-call index arithmetic, no sorting or
+threshold scans on the hot path.
+"""
+from typing import Sequence
+
+from catqdm.catbar import CATS_5PCT
+
+# Kaomoji faces, sad -> happy, shared with cat_bar.
+ASCII_CAT_FACES: Sequence[str] = CATS_5PCT
+
+# Emoji variant (roughly the commented-out set in catbar).
+EMOJI_CATS: Sequence[str] = [
+    "😿", "😽", "😾", "😼", "🙀", "😸", "😺", "😹", "😻",
+]
+
+# Minimal ASCII-only variant for dumb terminals / logs.
+SIMPLE_CATS: Sequence[str] = [
+    ">_<", ";_;", "-_-", "o_o", "^_^", "^o^",
+]
+
+# Color thresholds for rich-style markup: progress >= threshold -> color.
+PROGRESS_COLORS = {
+    0: "red",
+    25: "yellow",
+    50: "cyan",
+    75: "green",
+    90: "bright_green",
+}
+
+
+def _faces_by_pct(faces: Sequence[str]):
+    """Dense per-percent face table: ``table[p]`` for ``p`` in 0..100."""
+    last = len(faces) - 1
+    return tuple(faces[min(int(p / 100 * len(faces)), last)] for p in range(101))
+
+
+def _colors_by_pct():
+    thresholds = sorted(PROGRESS_COLORS.items())  # once, at import
+    table = []
+    color = thresholds[0][1]
+    for p in range(101):
+        for threshold, c in thresholds:
+            if p >= threshold:
+                color = c
+        table.append(color)
+    return tuple(table)
+
+
+_ASCII_BY_PCT = _faces_by_pct(ASCII_CAT_FACES)
+_EMOJI_BY_PCT = _faces_by_pct(EMOJI_CATS)
+_SIMPLE_BY_PCT = _faces_by_pct(SIMPLE_CATS)
+_COLOR_BY_PCT = _colors_by_pct()
+# Rich markup ("[color]face[/]") composed once per percent as well.
+RICH_CAT_MOODS = tuple(
+    f"[{_COLOR_BY_PCT[p]}]{_ASCII_BY_PCT[p]}[/]" for p in range(101)
+)
+
+_FACE_TABLES = {
+    "ascii": _ASCII_BY_PCT,
+    "emoji": _EMOJI_BY_PCT,
+    "simple": _SIMPLE_BY_PCT,
+}
+
+
+def _clamp_pct(progress_pct) -> int:
+    p = int(progress_pct)
+    if p < 0:
+        return 0
+    if p > 100:
+        return 100
+    return p
+
+
+def get_cat_for_progress(progress_pct, style: str = "ascii") -> str:
+    """Face for *progress_pct* (0..100, clamped) in the given style."""
+    return _FACE_TABLES[style][_clamp_pct(progress_pct)]
+
+
+def get_color_for_progress(progress_pct) -> str:
+    """Color name for *progress_pct*, per the PROGRESS_COLORS thresholds."""
+    return _COLOR_BY_PCT[_clamp_pct(progress_pct)]
+
+
+def get_rich_cat_with_color(progress_pct) -> str:
+    """Face for *progress_pct* wrapped in rich color markup."""
+    return RICH_CAT_MOODS[_clamp_pct(progress_pct)]
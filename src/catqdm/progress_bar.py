@@ -0,0 +1,556 @@
+"""Standalone cat progress bar (paw prints behind a walking cat).
+
+Unlike the tqdm wrappers (:mod:`catqdm.catbar`, :mod:`catqdm.big_cat_bar`)
+this draws its own bar: ``🐾`` for completed cells, a ``🐱`` at the front,
+``░`` for the remainder, plus tqdm-style metrics and an optional postfix.
+
+Terminal rendering goes through rich's ``Live`` so the bar repaints in
+place; in notebooks the bar is a single HTML display updated through a
+persistent display handle, same as the big-cat notebook backend.
+"""
+import math
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
+
+from catqdm._fast import compute_metrics
+
+# rich (terminal) and IPython (notebook) are both heavy imports and each
+# path needs only one of them, so they are imported in _init_display and
+# the classes bound on the instance.
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.console import Console
+    from rich.live import Live
+    from rich.text import Text
+
+
+@lru_cache(maxsize=1)
+def _in_notebook() -> bool:
+    """Rudimentary notebook detection (IPython kernel / Jupyter / Colab).
+
+    Cached: the answer cannot change within a process, and every bar
+    construction asks.
+    """
+    try:  # pragma: no cover - light best-effort
+        from IPython import get_ipython  # type: ignore
+        ip = get_ipython()
+        if ip is None:
+            return False
+        if ip.__class__.__name__.startswith("ZMQ"):
+            return True
+        return "IPKernelApp" in getattr(ip, "config", {})
+    except Exception:
+        return False
+
+
+_UNSET = object()  # sentinel: distinguishes "absent" from a stored None
+
+
+def _format_plain(n: float) -> str:
+    """Unscaled count formatter; bound per-instance when unit_scale is off."""
+    return f"{int(n)}"
+
+
+def _fmt_postfix_float(value: float) -> str:
+    return f"{value:.3f}" if -100 < value < 100 else f"{value:.1f}"
+
+
+def _fmt_postfix_int(value: int) -> str:
+    return f"{value:,}" if value > 1000 else str(value)
+
+
+# The whole notebook document, compiled once: %-substitution fills all
+# four slots in a single pass instead of per-fragment f-string steps.
+_HTML_TMPL = (
+    '<pre style="margin:0;line-height:1.1;">%(prefix)s%(bar)s'
+    '<span style="color: white;"> %(metrics)s</span>%(postfix)s</pre>'
+)
+
+# Exact-type dispatch for postfix values: one dict lookup instead of an
+# isinstance chain. Subclasses (bool, numpy scalars) fall through to
+# str(); add their types here to opt them into numeric formatting.
+_FMT = {float: _fmt_postfix_float, int: _fmt_postfix_int}
+
+
+def _fmt_hms(seconds: float) -> str:
+    """``H:MM:SS`` from seconds via integer math — no timedelta/str.split."""
+    s = int(seconds)
+    return f"{s // 3600:d}:{(s // 60) % 60:02d}:{s % 60:02d}"
+
+
+class CatProgressBar:
+    """Progress bar drawing paw prints behind a walking cat.
+
+    Parameters
+    ----------
+    total:
+        Number of steps.
+    description:
+        Label shown before the bar.
+    width:
+        Bar width in cells.
+    unit, unit_scale, unit_divisor:
+        Rate formatting, tqdm-style: when ``unit_scale`` is on, counts and
+        rates are scaled with K/M/G/T suffixes by ``unit_divisor``.
+    background:
+        Terminal path only: render from a daemon thread at the refresh
+        cadence, so update() is nothing but a counter write on the
+        caller's thread. Intermediate states between paints are dropped.
+    """
+
+    DESC_COLOR = "cyan"
+    PAW = "🐾"
+    CAT = "🐱"
+    EMPTY = "░"
+
+    # Per-cell HTML spans; identical for every cell of a kind, so bars are
+    # assembled by string multiplication rather than a per-cell loop.
+    _HTML_PAW = '<span style="color: green;">🐾</span>'
+    _HTML_CAT = '<span style="color: yellow; font-weight: bold;">🐱</span>'
+    _HTML_EMPTY = '<span style="color: #666;">░</span>'
+
+    def __init__(
+        self,
+        total: int,
+        description: str = "Progress",
+        width: int = 40,
+        unit: str = "it",
+        unit_scale: bool = False,
+        unit_divisor: int = 1000,
+        background: bool = False,
+    ):
+        self.total = total
+        self.description = description
+        self.width = width
+        self.unit = unit
+        self.unit_scale = unit_scale
+        self.unit_divisor = unit_divisor
+        # Specialize at construction: with scaling off the formatter is a
+        # plain int format (no branch per call), and the constant total is
+        # formatted exactly once for the whole run.
+        if not unit_scale:
+            self._format_number = _format_plain
+        self._total_str = self._format_number(total)
+        # Single-slot cache for the formatted rate (see _get_metrics).
+        self._last_rate_bucket = None
+        self._last_rate_str = "0"
+        # Smoothed rate + cached metrics line: the EWMA damps per-step
+        # jitter in the displayed rate, and renders where current hasn't
+        # moved (pure time ticks) reuse the last formatted string.
+        self._rate_ewma = 0.0
+        self._metrics_current = -1
+        self._metrics_time = 0.0  # re-anchored on the first metrics render
+        self._metrics_cached: Optional[str] = None
+        self.current = 0
+        # Step counts at which each bar cell fills (ceil(i*total/width),
+        # precomputed once). _maybe_advance walks a monotonic pointer over
+        # this table, so update() decides "did a cell fill?" with one
+        # integer compare instead of a mul+div, and skips the whole
+        # repaint machinery when the answer is no.
+        self._thresholds = [
+            -(-(i + 1) * total // self.width) for i in range(self.width)
+        ] if total else []
+        self._filled = 0
+        # (progress_pct, filled) for the current state, specialized at
+        # construction: total is immutable, so the zero-total branch and
+        # the 100/total division are resolved once here instead of per
+        # paint, and the renderers call a closure over hoisted constants.
+        if total == 0:
+            self._compute = lambda: (0.0, 0)
+        else:
+            inv_total = 100.0 / total
+            width = self.width
+            self._compute = lambda: (
+                self.current * inv_total,
+                self.current * width // total,
+            )
+        self.postfix: dict = {}
+        self._postfix_formatted: dict = {}
+        self.in_notebook = _in_notebook()
+        # Console() probes the terminal (size, color system) at
+        # construction; the notebook path never uses it, so it is created
+        # lazily by the terminal branch of _init_display.
+        self.console: Optional["Console"] = None
+        self.live: Optional["Live"] = None
+        self.display_handle = None
+        self._Text = None  # rich.text.Text, bound by _init_display
+        self._HTML = None  # IPython.display.HTML, bound by _init_display
+        # Monotonic float timebase: elapsed/rate math stays allocation-free
+        # (datetime/timedelta objects would be built on every render).
+        self._start_monotonic = time.monotonic()
+        # Repaints are gated to the Live refresh cadence: update(1) in a
+        # tight loop shouldn't re-render the world faster than the display
+        # can show it. The 100% frame always paints.
+        self._min_interval = 1.0 / 10  # matches refresh_per_second=10
+        self._last_render = 0.0
+        # The bar body is a pure function of (filled, done, html_mode) and
+        # filled only takes width+1 values over a whole run, so rendered
+        # fragments are cached: O(total) bar rebuilds collapse to O(width).
+        self._bar_cache: dict = {}
+        # The description prefix only changes via set_description; cache
+        # both the HTML span and the styled Text head instead of
+        # reformatting them every paint.
+        self._rebuild_prefixes()
+        # One long-lived Text refilled in place per frame; a fresh Text
+        # (plus its span list) per paint is avoidable GC churn. Created
+        # with the rich import in _init_display.
+        self._display_text: Optional["Text"] = None
+        # Training loops often push an identical rounded postfix many
+        # times in a row; remember what was last rendered so those calls
+        # become no-ops.
+        self._last_postfix_rendered: Optional[str] = None
+        self._last_rendered_current = -1
+        self._last_display_key = None
+        self.background = background
+        self._render_thread: Optional[threading.Thread] = None
+        self._stop_render = threading.Event()
+
+    def _rebuild_prefixes(self) -> None:
+        self._html_prefix = (
+            f'<span style="color: {self.DESC_COLOR}; font-weight: bold;">'
+            f"{self.description}: </span>"
+        )
+        if self._Text is not None:
+            self._text_prefix = self._Text(
+                f"{self.description}: ", style=f"bold {self.DESC_COLOR}"
+            )
+
+    # ------------------------------------------------------------------ #
+    # lifecycle
+    # ------------------------------------------------------------------ #
+
+    def __enter__(self) -> "CatProgressBar":
+        self._init_display()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _init_display(self) -> None:
+        if self.live is not None or self.display_handle is not None:
+            return  # idempotent: iter() inside a with-block must not re-init
+        if self.in_notebook:
+            try:
+                from IPython.display import display, HTML
+                self._HTML = HTML
+                self.display_handle = display(
+                    HTML(self._create_html_display()), display_id=True
+                )
+            except Exception:  # pragma: no cover - no IPython after all
+                self.display_handle = None
+        else:
+            from rich.console import Console
+            from rich.live import Live
+            from rich.style import Style
+            from rich.text import Text
+
+            self._Text = Text
+            self._Style = Style
+            # Styles pre-resolved once; passing strings to Text.append
+            # would make rich re-parse them on every paint.
+            self._style_paw = Style(color="green")
+            self._style_cat = Style(color="bright_yellow")
+            self._style_empty = Style(dim=True)
+            self._style_metrics = Style(color="white")
+            self._postfix_style = ("magenta", Style(color="magenta"))
+            self._rebuild_prefixes()
+            self._display_text = Text()
+            if self.console is None:
+                self.console = Console()
+            self.live = Live(
+                self._create_display(), console=self.console, refresh_per_second=10
+            )
+            self.live.start()
+            if self.background:
+                self._stop_render.clear()
+                self._render_thread = threading.Thread(
+                    target=self._render_loop, daemon=True
+                )
+                self._render_thread.start()
+
+    def _render_loop(self) -> None:
+        # Reads current/postfix under the GIL and tail-drops intermediate
+        # states; the caller's thread never pays for rendering.
+        while not self._stop_render.wait(self._min_interval):
+            self.live.update(self._create_display())
+
+    def close(self) -> None:
+        """Draw the final state and release the live display."""
+        if self._render_thread is not None:
+            self._stop_render.set()
+            self._render_thread.join()
+            self._render_thread = None
+        self._update_display()
+        if self.live is not None:
+            self.live.stop()
+            self.live = None
+
+    # ------------------------------------------------------------------ #
+    # progress API
+    # ------------------------------------------------------------------ #
+
+    def update(self, n: int = 1) -> None:
+        """Advance the bar by *n* steps and repaint.
+
+        Repaints only when a new bar cell fills or the run completes;
+        counts and metrics therefore refresh at cell granularity.
+        Postfix changes repaint through set_postfix and are unaffected.
+        """
+        if self.total:
+            self.current = min(self.current + n, self.total)
+            filled = self._filled
+            if self._maybe_advance(self.current) == filled and self.current < self.total:
+                return
+        else:
+            self.current += n
+        self._update_display()
+
+    def _maybe_advance(self, current: int) -> int:
+        """Advance the filled-cell pointer past any newly crossed thresholds."""
+        filled = self._filled
+        thresholds = self._thresholds
+        while filled < self.width and current >= thresholds[filled]:
+            filled += 1
+        self._filled = filled
+        return filled
+
+    def iter(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        """Iterate *iterable*, advancing the bar once per item.
+
+        Fast path: instead of going through update() per item (method
+        call, clamp, render attempt), the loop keeps a local counter and
+        only touches the display every ~0.1% of total, leaving the
+        per-item cost at an increment and one comparison. update(n) stays
+        the generic API for out-of-loop callers.
+        """
+        with self:
+            total = self.total
+            render_every = max(1, total // 1000) if total else 1
+            current = self.current
+            next_render = current + render_every
+            for item in iterable:
+                yield item
+                current += 1
+                if current >= next_render:
+                    self.current = min(current, total) if total else current
+                    self._update_display()
+                    next_render = current + render_every
+            self.current = min(current, total) if total else current
+
+    def set_description(self, description: str) -> None:
+        self.description = description
+        self._rebuild_prefixes()
+        self._update_display()
+
+    def set_postfix(self, **kwargs) -> None:
+        """Merge *kwargs* into the postfix shown after the metrics.
+
+        Only keys whose value actually changed are re-formatted; the
+        rest reuse their cached ``key=value`` strings. Skips the repaint
+        entirely when the formatted postfix comes out identical to what
+        is already on screen for the same progress.
+        """
+        for k, v in kwargs.items():
+            if k != "_color" and self.postfix.get(k, _UNSET) != v:
+                self._postfix_formatted[k] = f"{k}={self._format_postfix_value(v)}"
+        self.postfix.update(kwargs)
+        rendered = self._format_postfix_display(html_mode=self.in_notebook)
+        if rendered == self._last_postfix_rendered and self.current == self._last_rendered_current:
+            return
+        self._last_postfix_rendered = rendered
+        self._last_rendered_current = self.current
+        self._update_display()
+
+    def set_postfix_str(self, postfix: str) -> None:
+        """Replace the whole postfix with a pre-formatted string."""
+        self.postfix = {"_str": postfix} if postfix else {}
+        self._postfix_formatted.clear()
+        self._update_display()
+
+    def set_postfix_dict(self, postfix: dict) -> None:
+        """Replace the whole postfix dict (set_postfix merges instead)."""
+        self.postfix = dict(postfix)
+        self._postfix_formatted = {
+            k: f"{k}={self._format_postfix_value(v)}"
+            for k, v in postfix.items()
+            if k != "_color"
+        }
+        self._update_display()
+
+    # ------------------------------------------------------------------ #
+    # rendering
+    # ------------------------------------------------------------------ #
+
+    def _update_display(self) -> None:
+        now = time.monotonic()
+        if now - self._last_render < self._min_interval and self.current < self.total:
+            return
+        self._last_render = now
+        if self.in_notebook and self.display_handle is not None:
+            # Each handle.update crosses the Jupyter comm channel; skip
+            # the IPC when nothing visible changed (metrics text only
+            # matters when the bar or postfix moved too).
+            key = (
+                self._compute()[1],
+                self.current >= self.total,
+                self.description,
+                self._format_postfix_display(html_mode=True),
+            )
+            if key == self._last_display_key:
+                return
+            self._last_display_key = key
+            self.display_handle.update(self._HTML(self._create_html_display()))
+        elif self.live is not None:
+            if self._render_thread is not None:
+                return  # the worker owns terminal painting
+            self.live.update(self._create_display())
+
+    def _build_progress_bar(self, html_mode: bool):
+        """Bar body: an HTML string, or ``(char, style)`` tuples for rich.
+
+        Cached by ``(filled, done, html_mode)`` — see ``_bar_cache``.
+        """
+        progress_pct, filled = self._compute()
+        key = (filled, progress_pct >= 100.0, html_mode)
+        hit = self._bar_cache.get(key)
+        if hit is not None:
+            return hit
+
+        # Every cell of a kind is identical, so the bar is three C-level
+        # string multiplications instead of a width-long Python loop. Rich
+        # mode mirrors that with three (segment, style) chunks.
+        done = progress_pct >= 100.0
+        width = self.width
+        if html_mode:
+            if done:
+                bar = self._HTML_PAW * width
+            elif filled == 0:
+                bar = self._HTML_EMPTY * width
+            else:
+                bar = (
+                    self._HTML_PAW * (filled - 1)
+                    + self._HTML_CAT
+                    + self._HTML_EMPTY * (width - filled)
+                )
+        else:
+            if done:
+                bar = ((self.PAW * width, self._style_paw),)
+            elif filled == 0:
+                bar = ((self.EMPTY * width, self._style_empty),)
+            else:
+                bar = (
+                    (self.PAW * (filled - 1), self._style_paw),
+                    (self.CAT, self._style_cat),
+                    (self.EMPTY * (width - filled), self._style_empty),
+                )
+        self._bar_cache[key] = bar
+        return bar
+
+    def _create_display(self) -> "Text":
+        """Rich renderable for the terminal path (one reused Text)."""
+        text = self._display_text
+        text.truncate(0)
+        text.append_text(self._text_prefix)
+        for segment, style in self._build_progress_bar(html_mode=False):
+            text.append(segment, style=style)
+        text.append(" " + self._get_metrics(), style=self._style_metrics)
+        postfix = self._format_postfix_display(html_mode=False)
+        if postfix:
+            color = self.postfix.get("_color", "magenta")
+            cached_color, style = self._postfix_style
+            if color != cached_color:
+                style = self._Style.parse(color)
+                self._postfix_style = (color, style)
+            text.append(postfix, style=style)
+        return text
+
+    def _create_html_display(self) -> str:
+        """HTML for the notebook path.
+
+        Prefix and bar are cached strings; the document is assembled by
+        one %-substitution into the precompiled ``_HTML_TMPL``.
+        """
+        return _HTML_TMPL % {
+            "prefix": self._html_prefix,
+            "bar": self._build_progress_bar(html_mode=True),
+            "metrics": self._get_metrics(),
+            "postfix": self._format_postfix_display(html_mode=True),
+        }
+
+    # ------------------------------------------------------------------ #
+    # metrics / formatting
+    # ------------------------------------------------------------------ #
+
+    def _get_metrics(self) -> str:
+        current = self.current
+        if current == self._metrics_current and self._metrics_cached is not None:
+            return self._metrics_cached
+        # The numeric part lives in _fast.compute_metrics (numba-jitted
+        # when installed); only the string formatting happens here.
+        now = time.monotonic()
+        _, elapsed, _, avg_rate = compute_metrics(
+            current, self.total, self.width, self._start_monotonic, now
+        )
+        # Blend the instantaneous rate since the last metrics render into
+        # an EWMA (seeded from the lifetime average) so the display
+        # doesn't jitter step to step; ETA follows the smoothed rate.
+        dt = now - self._metrics_time
+        delta = current - self._metrics_current
+        if self._rate_ewma > 0 and dt > 0 and delta > 0:
+            self._rate_ewma = 0.8 * self._rate_ewma + 0.2 * (delta / dt)
+        else:
+            self._rate_ewma = avg_rate
+        rate = self._rate_ewma
+        self._metrics_current = current
+        self._metrics_time = now
+        elapsed_str = _fmt_hms(elapsed)
+        if self.total and rate > 0 and current < self.total:
+            eta_str = _fmt_hms((self.total - current) / rate)
+        else:
+            eta_str = "0:00:00"
+        # Rate moves slowly between paints; bucket it to display
+        # precision and reuse the formatted string on a repeat, so the
+        # log/divide in the scaled formatter isn't paid every frame.
+        bucket = round(rate, 1) if rate < 1000 else int(rate)
+        if bucket != self._last_rate_bucket:
+            self._last_rate_bucket = bucket
+            self._last_rate_str = self._format_number(rate)
+        self._metrics_cached = (
+            f"{self._format_number(current)}/{self._total_str} "
+            f"[{elapsed_str}<{eta_str}, {self._last_rate_str}{self.unit}/s]"
+        )
+        return self._metrics_cached
+
+    def _format_number(self, n: float) -> str:
+        # Only reached with unit_scale on (see __init__); one log call
+        # picks the magnitude instead of a divide-per-suffix loop.
+        a = abs(n)
+        idx = min(4, int(math.log(a, self.unit_divisor))) if a >= self.unit_divisor else 0
+        if not idx:
+            return f"{n:.1f}" if n != int(n) else str(int(n))
+        return f"{n / self.unit_divisor ** idx:.1f}{' KMGT'[idx]}"
+
+    def _format_postfix_value(self, value: Any) -> str:
+        fmt = _FMT.get(type(value))
+        return fmt(value) if fmt is not None else str(value)
+
+    def _format_postfix_display(self, html_mode: bool) -> str:
+        joined = self.postfix.get("_str")
+        if joined is None:
+            if not self._postfix_formatted:
+                return ""
+            joined = ", ".join(self._postfix_formatted.values())
+        if html_mode:
+            color = self.postfix.get("_color", "magenta")
+            return f'<span style="color: {color};"> | {joined}</span>'
+        return " | " + joined
+
+
+if __name__ == "__main__":
+    import time
+
+    with CatProgressBar(100, description="Demo") as pbar:
+        for _ in range(100):
+            time.sleep(0.02)
+            pbar.update(1)